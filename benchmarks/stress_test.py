@@ -1,47 +1,56 @@
+import argparse
 import feather_db
 import numpy as np
 import time
 import psutil
 import os
+import tempfile
 from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 DIM = 768
 NUM_VECTORS = 100_000
 BATCH_SIZE = 10_000
-DB_PATH = "stress_test.feather"
 
-def generate_batch(size, dim):
-    return np.random.rand(size, dim).astype(np.float32)
+# name -> (dim, num_vectors); sizes are the raw float32 vector data
+PROFILES = {
+    "default": (DIM, NUM_VECTORS),  # ~307 MB
+    "cache":   (128, 1_000),        # ~0.5 MB
+    "memory":  (1024, 100_000),     # ~410 MB
+}
+
+def generate_batch(rng, size, dim):
+    return rng.random((size, dim), dtype=np.float32)
 
 def print_memory():
     process = psutil.Process(os.getpid())
     print(f"[Mem] {process.memory_info().rss / 1024 / 1024:.2f} MB")
 
-def run_stress_test():
-    if os.path.exists(DB_PATH):
-        os.remove(DB_PATH)
-
-    print(f"=== 🚀 Feather DB Stress Test ({NUM_VECTORS} vectors, {DIM} dim) ===")
+def run_stress_test(db_path, dim=DIM, num_vectors=NUM_VECTORS):
+    data_mb = num_vectors * dim * 4 / 1e6
+    print(f"=== 🚀 Feather DB Stress Test ({num_vectors} vectors, {dim} dim, {data_mb:.1f} MB) ===")
     
     # 1. Ingestion
     print("\n[Phase 1] Ingestion Speed Test")
-    db = feather_db.DB.open(DB_PATH, dim=DIM)
+    db = feather_db.DB.open(db_path, dim=dim, capacity=num_vectors)
+    rng = np.random.default_rng(0)
     
-    start_time = time.time()
-    for i in range(0, NUM_VECTORS, BATCH_SIZE):
-        batch = generate_batch(BATCH_SIZE, DIM)
-        for j in range(BATCH_SIZE):
-            db.add(i + j, batch[j])
-        print(f"   Saved {i + BATCH_SIZE}...")
+    # Only the insert calls are timed; generation and reporting are excluded
+    insert_ns = 0
+    for i in range(0, num_vectors, BATCH_SIZE):
+        batch = generate_batch(rng, min(BATCH_SIZE, num_vectors - i), dim)
+        t0 = time.perf_counter_ns()
+        db.add_batch_auto(batch)  # ids i .. i + len(batch) - 1
+        insert_ns += time.perf_counter_ns() - t0
+        print(f"   Saved {i + len(batch)}...")
         print_memory()
     
-    duration = time.time() - start_time
-    print(f"✅ Ingestion Complete: {duration:.2f}s ({NUM_VECTORS / duration:.0f} vectors/sec)")
+    duration = insert_ns / 1e9
+    print(f"✅ Ingestion Complete: {duration:.2f}s ({num_vectors / duration:.0f} vectors/sec)")
 
     # 2. Latency Test (Single Query)
     print("\n[Phase 2] Search Latency (P99)")
-    query = np.random.rand(DIM).astype(np.float32)
+    query = rng.random(dim, dtype=np.float32)
     latencies = []
     
     # Warmup
@@ -49,9 +58,9 @@ def run_stress_test():
 
     # Measure
     for _ in range(1000):
-        t0 = time.perf_counter()
+        t0 = time.perf_counter_ns()
         db.search(query, k=10)
-        latencies.append((time.perf_counter() - t0) * 1000) # ms
+        latencies.append((time.perf_counter_ns() - t0) / 1e6) # ms
 
     latencies.sort()
     p50 = latencies[500]
@@ -61,18 +70,24 @@ def run_stress_test():
     # 3. Graph/Link Stress
     print("\n[Phase 3] Graph Linking Stress")
     # Link every 10th item to the previous 10 items (dense local web)
-    link_start = time.time()
+    link_start = time.perf_counter_ns()
     count = 0
-    for i in range(10, 20000, 10): # First 20k
+    for i in range(10, min(20000, num_vectors), 10): # First 20k
         for j in range(1, 6):
            db.link(i, i-j)
            count += 1
     
-    link_duration = time.time() - link_start
+    link_duration = (time.perf_counter_ns() - link_start) / 1e9
     print(f"✅ Created {count} links in {link_duration:.3f}s ({count / link_duration:.0f} links/sec)")
 
     db.save()
     print("\nDone.")
 
 if __name__ == "__main__":
-    run_stress_test()
+    parser = argparse.ArgumentParser(description="Feather DB stress test")
+    parser.add_argument("--profile", choices=PROFILES, default="default",
+                        help="cache: ~0.5 MB of raw vectors; memory: ~410 MB of raw vectors")
+    args = parser.parse_args()
+    dim, num_vectors = PROFILES[args.profile]
+    with tempfile.TemporaryDirectory() as tmp:
+        run_stress_test(os.path.join(tmp, "stress_test.feather"), dim, num_vectors)
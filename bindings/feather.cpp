@@ -5,6 +5,9 @@
 
 namespace py = pybind11;
 
+// Inputs are cast to dense float32 so the raw buffer can be read row-major.
+using FloatArray = py::array_t<float, py::array::c_style | py::array::forcecast>;
+
 PYBIND11_MODULE(core, m) {
     m.doc() = "Feather: Embedded Vector Database + Living Context Engine";
 
@@ -129,11 +132,12 @@ PYBIND11_MODULE(core, m) {
     // ── DB ───────────────────────────────────────────────────────────
     py::class_<feather::DB, std::unique_ptr<feather::DB, py::nodelete>>(m, "DB")
         .def_static("open", &feather::DB::open,
-                    py::arg("path"), py::arg("dim") = 768)
+                    py::arg("path"), py::arg("dim") = 768,
+                    py::arg("capacity") = 1'000'000)
 
         // -- Ingestion --
         .def("add", [](feather::DB& db, uint64_t id,
-                        py::array_t<float> vec,
+                        FloatArray vec,
                         const std::optional<feather::Metadata>& meta,
                         const std::string& modality) {
             auto buf = vec.request();
@@ -144,8 +148,54 @@ PYBIND11_MODULE(core, m) {
            py::arg("meta") = std::nullopt,
            py::arg("modality") = "text")
 
+        .def("add_batch", [](feather::DB& db,
+                              py::object ids_obj,
+                              FloatArray vecs,
+                              const std::string& modality) {
+            if (vecs.ndim() != 2)
+                throw std::runtime_error("vecs must be a 2-D (N, dim) array");
+            py::array ids = py::array::ensure(ids_obj);
+            if (!ids || ids.ndim() != 1 || ids.shape(0) != vecs.shape(0))
+                throw std::runtime_error("ids must be a 1-D array with one id per row of vecs");
+            // Only integer ids are accepted: forcecasting floats or negatives
+            // straight to uint64 would silently truncate or wrap them.
+            char kind = ids.dtype().kind();
+            if (ids.size() > 0 && kind != 'i' && kind != 'u')
+                throw std::runtime_error("ids must have an integer dtype");
+            if (kind == 'i') {
+                auto signed_ids = py::array_t<int64_t, py::array::c_style | py::array::forcecast>::ensure(ids);
+                const int64_t* p = signed_ids.data();
+                if (std::any_of(p, p + signed_ids.shape(0), [](int64_t v) { return v < 0; }))
+                    throw std::runtime_error("ids must be non-negative");
+            }
+            auto id_arr = py::array_t<uint64_t, py::array::c_style | py::array::forcecast>::ensure(ids);
+            std::vector<uint64_t> id_list(id_arr.data(), id_arr.data() + id_arr.shape(0));
+            db.add_batch(id_list, vecs.data(), static_cast<size_t>(vecs.shape(1)), modality);
+        }, py::arg("ids"), py::arg("vecs"),
+           py::arg("modality") = "text",
+           "Add N vectors from an (N, dim) array in a single call.")
+
+        .def("add_auto", [](feather::DB& db, FloatArray vec,
+                             const std::optional<feather::Metadata>& meta,
+                             const std::string& modality) {
+            std::vector<float> v(vec.data(), vec.data() + vec.size());
+            return db.add_auto(v, meta ? *meta : feather::Metadata(), modality);
+        }, py::arg("vec"), py::arg("meta") = std::nullopt,
+           py::arg("modality") = "text",
+           "Add a vector under the next free id (one past the largest stored id) and return it.")
+
+        .def("add_batch_auto", [](feather::DB& db, FloatArray vecs,
+                                   const std::string& modality) {
+            if (vecs.ndim() != 2)
+                throw std::runtime_error("vecs must be a 2-D (N, dim) array");
+            auto ids = db.add_batch_auto(vecs.data(), static_cast<size_t>(vecs.shape(0)),
+                                         static_cast<size_t>(vecs.shape(1)), modality);
+            return py::array_t<uint64_t>(ids.size(), ids.data());
+        }, py::arg("vecs"), py::arg("modality") = "text",
+           "Add N vectors under consecutive new ids; returns the ids as a uint64 array.")
+
         // -- Search --
-        .def("search", [](feather::DB& db, py::array_t<float> q, size_t k,
+        .def("search", [](feather::DB& db, FloatArray q, size_t k,
                            const feather::SearchFilter* filter,
                            const feather::ScoringConfig* scoring,
                            const std::string& modality) {
@@ -157,6 +207,20 @@ PYBIND11_MODULE(core, m) {
            py::arg("filter") = nullptr, py::arg("scoring") = nullptr,
            py::arg("modality") = "text")
 
+        .def("search_batch", [](feather::DB& db, FloatArray qs, size_t k,
+                                 const feather::SearchFilter* filter,
+                                 const feather::ScoringConfig* scoring,
+                                 const std::string& modality) {
+            if (qs.ndim() != 2)
+                throw std::runtime_error("qs must be a 2-D (N, dim) array");
+            return db.search_batch(qs.data(), static_cast<size_t>(qs.shape(0)),
+                                   static_cast<size_t>(qs.shape(1)),
+                                   k, filter, scoring, modality);
+        }, py::arg("qs"), py::arg("k") = 5,
+           py::arg("filter") = nullptr, py::arg("scoring") = nullptr,
+           py::arg("modality") = "text",
+           "Search every row of an (N, dim) query matrix; returns one result list per row.")
+
         // -- Graph --
         .def("link", &feather::DB::link,
              py::arg("from_id"), py::arg("to_id"),
@@ -173,7 +237,7 @@ PYBIND11_MODULE(core, m) {
              py::arg("candidates") = 15,
              "Auto-create edges between records whose vector similarity exceeds threshold.")
 
-        .def("context_chain", [](feather::DB& db, py::array_t<float> q,
+        .def("context_chain", [](feather::DB& db, FloatArray q,
                                   size_t k, int hops, const std::string& modality) {
             auto buf = q.request();
             const float* ptr = static_cast<const float*>(buf.ptr);
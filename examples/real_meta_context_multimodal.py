@@ -391,7 +391,6 @@ if vis_query_id:
     # Get its visual vec by searching with a near-zero query and filtering
     f_vis = FilterBuilder().namespace("hawky_meta").attribute("record_type", "ad")
     # Use the text vec as cross-modal proxy query
-    import feather_db as _fdb
     text_results = db.search(
         np.zeros(128, dtype=np.float32), k=5, modality="visual", filter=f_vis.build()
     )
@@ -1,7 +1,8 @@
 use clap::{Parser, Subcommand};
-use std::path::PathBuf;
+use std::io::BufRead;
+use std::path::{Path, PathBuf};
 use feather_db_cli::DB;
-use ndarray::Array1;
+use ndarray::{Array1, Array2};
 
 #[derive(Parser)]
 #[command(name = "feather")]
@@ -17,6 +18,7 @@ enum Commands {
         db: PathBuf, 
         id: u64, 
         #[arg(short)] npy: PathBuf,
+        #[arg(long)] row: Option<usize>,
         #[arg(long)] timestamp: Option<i64>,
         #[arg(long, default_value_t = 1.0)] importance: f32,
         #[arg(long, default_value_t = 0)] context_type: u8,
@@ -32,11 +34,103 @@ enum Commands {
     Search { 
         db: PathBuf, 
         #[arg(short)] npy: PathBuf, 
+        #[arg(long)] row: Option<usize>,
         #[arg(long, default_value_t = 5)] k: usize,
         #[arg(long)] type_filter: Option<u8>,
         #[arg(long)] source_filter: Option<String>,
         #[arg(long, default_value = "text")] modality: String,
     },
+    /// Run newline-delimited commands from stdin against one open database:
+    /// `add <id> <npy> [row]`, `search <npy> <k> [row]`, `link <from> <to>`, `save`
+    Batch { db: PathBuf },
+}
+
+/// Read a 1-D vector, or row `row` of a 2-D (N, dim) matrix, from a .npy file.
+fn read_vector(npy: &Path, row: Option<usize>) -> anyhow::Result<Array1<f32>> {
+    match row {
+        None => Ok(ndarray_npy::read_npy(npy)?),
+        Some(r) => {
+            let mat: Array2<f32> = ndarray_npy::read_npy(npy)?;
+            anyhow::ensure!(r < mat.nrows(), "Row {} out of range: {:?} has {} rows", r, npy, mat.nrows());
+            Ok(mat.row(r).to_owned())
+        }
+    }
+}
+
+fn now_ts() -> i64 {
+    std::time::SystemTime::now()
+        .duration_since(std::time::UNIX_EPOCH)
+        .unwrap()
+        .as_secs() as i64
+}
+
+fn print_hits(ids: &[u64], dists: &[f32]) {
+    for (id, dist) in ids.iter().zip(dists.iter()) {
+        if *id != 0 || *dist != 0.0 {
+            println!("ID: {}  Score: {:.4}", id, dist);
+        }
+    }
+}
+
+fn parse_row(rest: &[&str]) -> anyhow::Result<Option<usize>> {
+    match rest {
+        [] => Ok(None),
+        [r] => Ok(Some(r.parse()?)),
+        _ => anyhow::bail!("Unexpected arguments: {}", rest.join(" ")),
+    }
+}
+
+/// Open the database on first use, once the vector dimension is known.
+fn open_lazy<'a>(db: &'a mut Option<DB>, path: &Path, dim: usize) -> anyhow::Result<&'a DB> {
+    if db.is_none() {
+        *db = Some(DB::open(path, dim).ok_or_else(|| anyhow::anyhow!("Open failed"))?);
+    }
+    Ok(db.as_ref().unwrap())
+}
+
+fn run_batch(path: &Path) -> anyhow::Result<()> {
+    let mut db: Option<DB> = None;
+    for (lineno, line) in std::io::stdin().lock().lines().enumerate() {
+        let line = line?;
+        let args: Vec<&str> = line.split_whitespace().collect();
+        match args.as_slice() {
+            [] => {}
+            [cmd, ..] if cmd.starts_with('#') => {}
+            ["add", id, npy, rest @ ..] => {
+                let id: u64 = id.parse()?;
+                let arr = read_vector(Path::new(npy), parse_row(rest)?)?;
+                let db = open_lazy(&mut db, path, arr.len())?;
+                db.add_with_meta(id, arr.as_slice().unwrap(), now_ts(), 1.0, 0, None, None, Some("text"));
+                println!("Added ID {} to modality 'text'", id);
+            }
+            ["search", npy, k, rest @ ..] => {
+                let k: usize = k.parse()?;
+                let arr = read_vector(Path::new(npy), parse_row(rest)?)?;
+                let db = open_lazy(&mut db, path, arr.len())?;
+                let (ids, dists) = db.search(arr.as_slice().unwrap(), k, Some("text"));
+                print_hits(&ids, &dists);
+            }
+            ["link", from, to] => {
+                let (from, to): (u64, u64) = (from.parse()?, to.parse()?);
+                // Opening a new file here would create it with a 0-dim index
+                if db.is_none() && !path.exists() {
+                    anyhow::bail!("Line {}: database not open yet; add a vector first", lineno + 1);
+                }
+                open_lazy(&mut db, path, 0)?.link(from, to);
+                println!("Linked {} -> {}", from, to);
+            }
+            ["save"] => {
+                if let Some(db) = &db {
+                    db.save();
+                }
+            }
+            _ => anyhow::bail!("Line {}: unrecognized batch command: {}", lineno + 1, line),
+        }
+    }
+    if let Some(db) = &db {
+        db.save();
+    }
+    Ok(())
 }
 
 fn main() -> anyhow::Result<()> {
@@ -46,17 +140,12 @@ fn main() -> anyhow::Result<()> {
             DB::open(&path, dim).ok_or_else(|| anyhow::anyhow!("Failed to create DB"))?;
             println!("Created: {:?}", path);
         }
-        Commands::Add { db, id, npy, timestamp, importance, context_type, source, content, modality } => {
-            let arr: Array1<f32> = ndarray_npy::read_npy(&npy)?;
+        Commands::Add { db, id, npy, row, timestamp, importance, context_type, source, content, modality } => {
+            let arr = read_vector(&npy, row)?;
             let dim = arr.len();
             let db = DB::open(&db, dim).ok_or_else(|| anyhow::anyhow!("Open failed"))?;
             
-            let ts = timestamp.unwrap_or_else(|| {
-                std::time::SystemTime::now()
-                    .duration_since(std::time::UNIX_EPOCH)
-                    .unwrap()
-                    .as_secs() as i64
-            });
+            let ts = timestamp.unwrap_or_else(now_ts);
 
             db.add_with_meta(
                 id, arr.as_slice().unwrap(), 
@@ -72,8 +161,8 @@ fn main() -> anyhow::Result<()> {
             db.save();
             println!("Linked {} -> {}", from, to);
         }
-        Commands::Search { db, npy, k, type_filter, source_filter, modality } => {
-            let arr: Array1<f32> = ndarray_npy::read_npy(&npy)?;
+        Commands::Search { db, npy, row, k, type_filter, source_filter, modality } => {
+            let arr = read_vector(&npy, row)?;
             let dim = arr.len();
             let db = DB::open(&db, dim).ok_or_else(|| anyhow::anyhow!("Open failed"))?;
             
@@ -83,12 +172,9 @@ fn main() -> anyhow::Result<()> {
                 db.search(arr.as_slice().unwrap(), k, Some(&modality))
             };
 
-            for (id, dist) in ids.iter().zip(dists.iter()) {
-                if *id != 0 || *dist != 0.0 {
-                    println!("ID: {}  Score: {:.4}", id, dist);
-                }
-            }
+            print_hits(&ids, &dists);
         }
+        Commands::Batch { db } => run_batch(&db)?,
     }
     Ok(())
 }
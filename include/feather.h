@@ -11,6 +11,7 @@
 #include <unordered_set>
 #include <cmath>
 #include <queue>
+#include <limits>
 #include "hnswlib.h"
 #include "metadata.h"
 #include "filter.h"
@@ -36,6 +37,12 @@ private:
 
     std::unordered_map<std::string, ModalityIndex> modality_indices_;
     std::string path_;
+    // Initial HNSW slot count for new modality indices; grows on demand
+    size_t capacity_ = 1'000'000;
+    // Next id handed out by add_auto(): one past the largest id stored so far.
+    // Once UINT64_MAX itself is stored there is no next id and auto ids are exhausted.
+    uint64_t next_id_ = 0;
+    bool     auto_ids_exhausted_ = false;
     std::unordered_map<uint64_t, Metadata> metadata_store_;
 
     // Reverse index: target_id → list of (source_id, rel_type, weight)
@@ -48,7 +55,7 @@ private:
         if (it == modality_indices_.end()) {
             auto space = std::make_unique<hnswlib::L2Space>(dim);
             auto index = std::make_unique<hnswlib::HierarchicalNSW<float>>(
-                space.get(), 1'000'000, 16, 200);
+                space.get(), capacity_, 16, 200);
             modality_indices_[modality] = {std::move(index), std::move(space), dim};
             return modality_indices_[modality];
         }
@@ -64,6 +71,44 @@ private:
         }
     }
 
+    // Grow the HNSW index (at least doubling) so `extra` more points fit.
+    static void ensure_capacity(ModalityIndex& m_idx, size_t extra) {
+        size_t needed = m_idx.index->cur_element_count + extra;
+        size_t cap = m_idx.index->getMaxElements();
+        if (needed <= cap) return;
+        m_idx.index->resizeIndex(std::max(needed, cap * 2));
+    }
+
+    void note_id(uint64_t id) {
+        if (id == std::numeric_limits<uint64_t>::max())
+            auto_ids_exhausted_ = true;
+        else
+            next_id_ = std::max(next_id_, id + 1);
+    }
+
+    // First of `n` consecutive unused ids for add_auto / add_batch_auto.
+    uint64_t reserve_auto_ids(size_t n) const {
+        if (n == 0) return next_id_;
+        if (auto_ids_exhausted_ ||
+            n - 1 > std::numeric_limits<uint64_t>::max() - next_id_)
+            throw std::overflow_error("Auto id space exhausted: ids would exceed UINT64_MAX");
+        return next_id_;
+    }
+
+    void store_metadata(uint64_t id, const Metadata& meta) {
+        note_id(id);
+        auto it = metadata_store_.find(id);
+        if (it != metadata_store_.end()) {
+            Metadata combined = meta;
+            // Preserve existing edges
+            if (combined.edges.empty() && !it->second.edges.empty())
+                combined.edges = it->second.edges;
+            it->second = std::move(combined);
+        } else {
+            metadata_store_[id] = meta;
+        }
+    }
+
     static std::string escape_json(const std::string& s) {
         std::string out;
         out.reserve(s.size() + 4);
@@ -146,6 +191,7 @@ private:
             while (f.read((char*)&id, 8)) {
                 Metadata meta = Metadata::deserialize(f);
                 f.read((char*)vec.data(), dim32 * sizeof(float));
+                ensure_capacity(m_idx, 1);
                 m_idx.index->addPoint(vec.data(), id);
                 metadata_store_[id] = std::move(meta);
             }
@@ -169,6 +215,7 @@ private:
                 f.read((char*)&dim32, 4);
                 f.read((char*)&element_count, 4);
                 auto& m_idx = get_or_create_index(name, dim32);
+                ensure_capacity(m_idx, element_count);
                 std::vector<float> vec(dim32);
                 for (uint32_t i = 0; i < element_count; ++i) {
                     uint64_t id;
@@ -179,6 +226,8 @@ private:
             }
         }
 
+        for (const auto& [id, _] : metadata_store_)
+            note_id(id);
         build_reverse_index();
     }
 
@@ -186,9 +235,12 @@ public:
     // ─────────────────────────────────────────────────────────────────
     // Factory
     // ─────────────────────────────────────────────────────────────────
-    static std::unique_ptr<DB> open(const std::string& path, size_t default_dim = 768) {
+    // `capacity` sizes each modality index up front; indices still grow past it.
+    static std::unique_ptr<DB> open(const std::string& path, size_t default_dim = 768,
+                                    size_t capacity = 1'000'000) {
         auto db = std::make_unique<DB>();
         db->path_ = path;
+        db->capacity_ = std::max<size_t>(capacity, 1);
         db->load_vectors();
         if (db->modality_indices_.empty())
             db->get_or_create_index("text", default_dim);
@@ -204,20 +256,43 @@ public:
         auto& m_idx = get_or_create_index(modality, vec.size());
         if (vec.size() != m_idx.dim)
             throw std::runtime_error("Dimension mismatch for modality " + modality);
+        ensure_capacity(m_idx, 1);
         m_idx.index->addPoint(vec.data(), id);
+        store_metadata(id, meta);
+    }
 
-        auto it = metadata_store_.find(id);
-        if (it != metadata_store_.end()) {
-            Metadata combined = meta;
-            // Preserve existing edges
-            if (combined.edges.empty() && !it->second.edges.empty())
-                combined.edges = it->second.edges;
-            metadata_store_[id] = combined;
-        } else {
-            metadata_store_[id] = meta;
+    // Batch ingestion: `data` holds ids.size() contiguous rows of `dim` floats.
+    void add_batch(const std::vector<uint64_t>& ids, const float* data, size_t dim,
+                   const std::string& modality = "text") {
+        auto& m_idx = get_or_create_index(modality, dim);
+        if (dim != m_idx.dim)
+            throw std::runtime_error("Dimension mismatch for modality " + modality);
+        ensure_capacity(m_idx, ids.size());
+        for (size_t i = 0; i < ids.size(); ++i) {
+            m_idx.index->addPoint(data + i * dim, ids[i]);
+            store_metadata(ids[i], Metadata());
         }
     }
 
+    // Add with a DB-assigned id; returns the id used.
+    uint64_t add_auto(const std::vector<float>& vec,
+                      const Metadata& meta = Metadata(),
+                      const std::string& modality = "text") {
+        uint64_t id = reserve_auto_ids(1);
+        add(id, vec, meta, modality);
+        return id;
+    }
+
+    // Batch variant of add_auto: rows get consecutive ids starting at next_id_.
+    std::vector<uint64_t> add_batch_auto(const float* data, size_t n, size_t dim,
+                                         const std::string& modality = "text") {
+        uint64_t first = reserve_auto_ids(n);
+        std::vector<uint64_t> ids(n);
+        for (size_t i = 0; i < n; ++i) ids[i] = first + i;
+        add_batch(ids, data, dim, modality);
+        return ids;
+    }
+
     // ─────────────────────────────────────────────────────────────────
     // Salience
     // ─────────────────────────────────────────────────────────────────
@@ -490,6 +565,7 @@ public:
 
     void update_metadata(uint64_t id, const Metadata& meta) {
         metadata_store_[id] = meta;
+        note_id(id);
         // Rebuild reverse index entries for this node
         for (auto& [target, incoming_list] : reverse_index_) {
             incoming_list.erase(
@@ -589,6 +665,27 @@ public:
         return results;
     }
 
+    // Run search() for each of `n` contiguous query rows of `dim` floats.
+    std::vector<std::vector<SearchResult>> search_batch(const float* queries, size_t n, size_t dim,
+                                                        size_t k = 5,
+                                                        const SearchFilter*  filter  = nullptr,
+                                                        const ScoringConfig* scoring = nullptr,
+                                                        const std::string&   modality = "text") {
+        auto m_it = modality_indices_.find(modality);
+        if (m_it == modality_indices_.end()) return std::vector<std::vector<SearchResult>>(n);
+        if (dim != m_it->second.dim)
+            throw std::runtime_error("Dimension mismatch for modality " + modality);
+
+        std::vector<std::vector<SearchResult>> out;
+        out.reserve(n);
+        std::vector<float> q(dim);
+        for (size_t i = 0; i < n; ++i) {
+            std::copy(queries + i * dim, queries + (i + 1) * dim, q.begin());
+            out.push_back(search(q, k, filter, scoring, modality));
+        }
+        return out;
+    }
+
     // ─────────────────────────────────────────────────────────────────
     // Persistence & info
     // ─────────────────────────────────────────────────────────────────
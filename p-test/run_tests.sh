@@ -43,30 +43,20 @@ else
     exit 1
 fi
 
-# Add vectors
+# Add vectors and search in a single CLI process
 echo ""
-echo "Test 2: Adding vectors..."
-./feather-cli/target/release/feather-cli add p-test/test.feather 1 -n p-test/test-data/vector1.npy
-echo "✓ Added vector 1"
-
-./feather-cli/target/release/feather-cli add p-test/test.feather 2 -n p-test/test-data/vector2.npy
-echo "✓ Added vector 2"
-
-./feather-cli/target/release/feather-cli add p-test/test.feather 3 -n p-test/test-data/vector3.npy
-echo "✓ Added vector 3"
-
-# Search
-echo ""
-echo "Test 3: Searching for similar vectors..."
-./feather-cli/target/release/feather-cli search p-test/test.feather -n p-test/test-data/query.npy --k 3
+echo "Test 2: Adding vectors and searching (batch mode)..."
+SEARCH_OUT=$(printf 'add 1 p-test/test-data/vectors.npy 0\nadd 2 p-test/test-data/vectors.npy 1\nadd 3 p-test/test-data/vectors.npy 2\nsearch p-test/test-data/vectors.npy 3 3\n' \
+    | ./feather-cli/target/release/feather-cli batch p-test/test.feather)
+echo "$SEARCH_OUT"
+echo "✓ Added vectors 1-3 and searched"
+echo "$SEARCH_OUT" | python3 p-test/test_rust_cli.py --check-search
 
 # Verify file
 echo ""
-echo "Test 4: Verifying database file..."
-ls -lh p-test/test.feather
-echo ""
-echo "File header (should start with FEAT magic number):"
-xxd p-test/test.feather | head -3
+echo "Test 3: Verifying database file..."
+python3 -c "import os, sys; p = 'p-test/test.feather'; h = open(p, 'rb').read(4); print(f'{os.path.getsize(p)} bytes, header {h!r}'); sys.exit(0 if h in (b'TAEF', b'FEAT') else 1)"
+echo "✓ FEAT magic number found"
 
 echo ""
 echo "=========================================="
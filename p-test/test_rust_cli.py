@@ -4,8 +4,19 @@ Test script for Feather Rust CLI
 Creates test .npy files and provides commands to test the CLI
 """
 
+import json
 import numpy as np
 import os
+import sys
+
+try:
+    import simsimd  # optional: SIMD reference kernels for the expected distances
+except ImportError:
+    simsimd = None
+
+_RNG = np.random.default_rng()
+
+EXPECTED_PATH = 'p-test/test-data/expected.json'
 
 def create_test_data():
     """Create test .npy files for CLI testing"""
@@ -17,30 +28,41 @@ def create_test_data():
     # Create vectors with 128 dimensions
     dim = 128
     
-    # Vector 1: Random normal distribution
-    vec1 = np.random.randn(dim).astype(np.float32)
-    np.save('p-test/test-data/vector1.npy', vec1)
-    print(f"✓ Created vector1.npy (shape: {vec1.shape}, dtype: {vec1.dtype})")
+    # Row 0 / 1: Random normal distribution
+    vec1 = _RNG.standard_normal(dim, dtype=np.float32)
+    vec2 = _RNG.standard_normal(dim, dtype=np.float32)
     
-    # Vector 2: Random normal distribution
-    vec2 = np.random.randn(dim).astype(np.float32)
-    np.save('p-test/test-data/vector2.npy', vec2)
-    print(f"✓ Created vector2.npy (shape: {vec2.shape}, dtype: {vec2.dtype})")
+    # Row 2: Similar to vector1 (for testing similarity)
+    vec3 = vec1 + _RNG.standard_normal(dim, dtype=np.float32) * 0.1
     
-    # Vector 3: Similar to vector1 (for testing similarity)
-    vec3 = vec1 + np.random.randn(dim).astype(np.float32) * 0.1
-    np.save('p-test/test-data/vector3.npy', vec3)
-    print(f"✓ Created vector3.npy (shape: {vec3.shape}, dtype: {vec3.dtype})")
+    # Row 3: Query vector, very similar to vector1
+    query = vec1 + _RNG.standard_normal(dim, dtype=np.float32) * 0.05
     
-    # Query vector: Very similar to vector1
-    query = vec1 + np.random.randn(dim).astype(np.float32) * 0.05
-    np.save('p-test/test-data/query.npy', query)
-    print(f"✓ Created query.npy (shape: {query.shape}, dtype: {query.dtype})")
+    # All four vectors go into one (4, dim) matrix; the CLI picks one with --row
+    vectors = np.stack([vec1, vec2, vec3, query])
+    np.save('p-test/test-data/vectors.npy', vectors, allow_pickle=False)
+    print(f"✓ Created vectors.npy (shape: {vectors.shape}, dtype: {vectors.dtype})")
+    print("  rows: 0=vector1, 1=vector2, 2=vector3, 3=query")
     
     # Calculate expected distances for verification
-    dist1 = np.sum((query - vec1) ** 2)
-    dist2 = np.sum((query - vec2) ** 2)
-    dist3 = np.sum((query - vec3) ** 2)
+    if simsimd is not None:
+        dists = np.array([simsimd.sqeuclidean(query, v) for v in vectors[:3]], dtype=np.float64)
+    else:
+        diffs = vectors[:3] - query
+        dists = np.einsum('ij,ij->i', diffs, diffs)
+    dist1, dist2, dist3 = dists
+    
+    # Known answers for the CLI run: IDs 1-3 are rows 0-2, score = 1 / (1 + dist)
+    expected = {
+        "dim": dim,
+        "query_row": 3,
+        "order": [int(i) + 1 for i in np.argsort(dists)],
+        "sqeuclidean": {str(i + 1): float(d) for i, d in enumerate(dists)},
+        "score": {str(i + 1): float(1.0 / (1.0 + d)) for i, d in enumerate(dists)},
+    }
+    with open(EXPECTED_PATH, 'w') as f:
+        json.dump(expected, f, indent=2)
+    print(f"✓ Created expected.json (reference: {'simsimd' if simsimd else 'numpy'})")
     
     print(f"\nExpected L2 distances from query:")
     print(f"  query → vector1: {dist1:.4f}")
@@ -52,33 +74,58 @@ def create_test_data():
 
 def print_test_commands(dim):
     """Print the test commands to run"""
-    print("\n" + "="*70)
-    print("TEST COMMANDS FOR RUST CLI")
-    print("="*70)
-    
-    print("\n1. Build the Rust CLI:")
-    print("   cd feather-cli")
-    print("   cargo build --release")
-    print("   cd ..")
-    
-    print("\n2. Create a new database:")
-    print(f"   ./feather-cli/target/release/feather-cli new p-test/test.feather --dim {dim}")
-    
-    print("\n3. Add vectors to database:")
-    print("   ./feather-cli/target/release/feather-cli add p-test/test.feather 1 -n p-test/test-data/vector1.npy")
-    print("   ./feather-cli/target/release/feather-cli add p-test/test.feather 2 -n p-test/test-data/vector2.npy")
-    print("   ./feather-cli/target/release/feather-cli add p-test/test.feather 3 -n p-test/test-data/vector3.npy")
-    
-    print("\n4. Search for similar vectors:")
-    print("   ./feather-cli/target/release/feather-cli search p-test/test.feather -n p-test/test-data/query.npy --k 3")
-    
-    print("\n5. Verify database file:")
-    print("   ls -lh p-test/test.feather")
-    print("   xxd p-test/test.feather | head -5")
-    
-    print("\n" + "="*70)
-    print("Expected search result: ID 1 should have smallest distance")
-    print("="*70 + "\n")
+    lines = [
+        "\n" + "="*70,
+        "TEST COMMANDS FOR RUST CLI",
+        "="*70,
+
+        "\n1. Build the Rust CLI:",
+        "   cd feather-cli",
+        "   cargo build --release",
+        "   cd ..",
+
+        "\n2. Create a new database:",
+        f"   ./feather-cli/target/release/feather-cli new p-test/test.feather --dim {dim}",
+
+        "\n3. Add vectors to database:",
+        "   ./feather-cli/target/release/feather-cli add p-test/test.feather 1 -n p-test/test-data/vectors.npy --row 0",
+        "   ./feather-cli/target/release/feather-cli add p-test/test.feather 2 -n p-test/test-data/vectors.npy --row 1",
+        "   ./feather-cli/target/release/feather-cli add p-test/test.feather 3 -n p-test/test-data/vectors.npy --row 2",
+
+        "\n4. Search for similar vectors:",
+        "   ./feather-cli/target/release/feather-cli search p-test/test.feather -n p-test/test-data/vectors.npy --row 3 --k 3",
+
+        "\n   Or run steps 3-4 in one process (opens the database once):",
+        "   printf 'add 1 p-test/test-data/vectors.npy 0\\nsearch p-test/test-data/vectors.npy 3 3\\n' | ./feather-cli/target/release/feather-cli batch p-test/test.feather",
+
+        "\n5. Verify database file:",
+        "   python3 -c \"p = 'p-test/test.feather'; print(open(p, 'rb').read(4))\"  # b'TAEF' (FEAT, little-endian)",
+
+        "\n" + "="*70,
+        "Expected search result: ID 1 should have smallest distance",
+        "="*70 + "\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def check_search_output(text, tol=1e-4):
+    """Compare `ID: <id>  Score: <score>` lines from the CLI against expected.json"""
+    with open(EXPECTED_PATH) as f:
+        expected = json.load(f)
+    hits = []
+    for line in text.splitlines():
+        if line.startswith("ID:"):
+            parts = line.split()
+            hits.append((int(parts[1]), float(parts[3])))
+    ids = [i for i, _ in hits]
+    if ids != expected["order"]:
+        print(f"❌ Search order {ids} != expected {expected['order']}")
+        return False
+    for i, score in hits:
+        if abs(score - expected["score"][str(i)]) > tol:
+            print(f"❌ ID {i}: score {score:.4f} != expected {expected['score'][str(i)]:.4f}")
+            return False
+    print(f"✓ Search results match expected.json (order {ids})")
+    return True
 
 def create_test_script():
     """Create a bash script to run all tests"""
@@ -127,30 +174,20 @@ else
     exit 1
 fi
 
-# Add vectors
+# Add vectors and search in a single CLI process
 echo ""
-echo "Test 2: Adding vectors..."
-./feather-cli/target/release/feather-cli add p-test/test.feather 1 -n p-test/test-data/vector1.npy
-echo "✓ Added vector 1"
-
-./feather-cli/target/release/feather-cli add p-test/test.feather 2 -n p-test/test-data/vector2.npy
-echo "✓ Added vector 2"
-
-./feather-cli/target/release/feather-cli add p-test/test.feather 3 -n p-test/test-data/vector3.npy
-echo "✓ Added vector 3"
-
-# Search
-echo ""
-echo "Test 3: Searching for similar vectors..."
-./feather-cli/target/release/feather-cli search p-test/test.feather -n p-test/test-data/query.npy --k 3
+echo "Test 2: Adding vectors and searching (batch mode)..."
+SEARCH_OUT=$(printf 'add 1 p-test/test-data/vectors.npy 0\\nadd 2 p-test/test-data/vectors.npy 1\\nadd 3 p-test/test-data/vectors.npy 2\\nsearch p-test/test-data/vectors.npy 3 3\\n' \\
+    | ./feather-cli/target/release/feather-cli batch p-test/test.feather)
+echo "$SEARCH_OUT"
+echo "✓ Added vectors 1-3 and searched"
+echo "$SEARCH_OUT" | python3 p-test/test_rust_cli.py --check-search
 
 # Verify file
 echo ""
-echo "Test 4: Verifying database file..."
-ls -lh p-test/test.feather
-echo ""
-echo "File header (should start with FEAT magic number):"
-xxd p-test/test.feather | head -3
+echo "Test 3: Verifying database file..."
+python3 -c "import os, sys; p = 'p-test/test.feather'; h = open(p, 'rb').read(4); print(f'{os.path.getsize(p)} bytes, header {h!r}'); sys.exit(0 if h in (b'TAEF', b'FEAT') else 1)"
+echo "✓ FEAT magic number found"
 
 echo ""
 echo "=========================================="
@@ -165,6 +202,9 @@ echo "=========================================="
     print("✓ Created executable test script: p-test/run_tests.sh")
 
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--check-search"]:
+        sys.exit(0 if check_search_output(sys.stdin.read()) else 1)
+    
     print("Feather Rust CLI Test Data Generator")
     print("=" * 70)
     